@@ -19,18 +19,6 @@ export async function PATCH(
     const body = await request.json();
     const { is_read, notes } = body;
 
-    // ブックマークの存在確認と権限チェック
-    const { data: bookmark, error: fetchError } = await supabase
-      .from("bookmarks")
-      .select("id, user_id")
-      .eq("id", params.id)
-      .eq("user_id", session.user.id)
-      .single();
-
-    if (fetchError || !bookmark) {
-      return NextResponse.json({ error: "Bookmark not found" }, { status: 404 });
-    }
-
     // 更新データの準備
     const updateData: any = {};
     if (typeof is_read === "boolean") {
@@ -40,11 +28,13 @@ export async function PATCH(
       updateData.notes = notes;
     }
 
-    // ブックマーク更新
+    // 事前の存在確認クエリは行わず、user_id条件付きの更新1発で
+    // 所有権チェックと更新をまとめる（該当なしはPGRST116で返る）
     const { data: updatedBookmark, error: updateError } = await supabase
       .from("bookmarks")
       .update(updateData)
       .eq("id", params.id)
+      .eq("user_id", session.user.id)
       .select(`
         id,
         created_at,
@@ -53,12 +43,15 @@ export async function PATCH(
         posts (
           id,
           title,
-          url,
+          url
         )
       `)
       .single();
 
     if (updateError) {
+      if (updateError.code === "PGRST116") {
+        return NextResponse.json({ error: "Bookmark not found" }, { status: 404 });
+      }
       console.error("Bookmark update error:", updateError);
       return NextResponse.json({ error: "Failed to update bookmark" }, { status: 500 });
     }
@@ -84,29 +77,24 @@ export async function DELETE(
       return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
 
-    // ブックマークの存在確認と権限チェック
-    const { data: bookmark, error: fetchError } = await supabase
+    // 事前の存在確認クエリは行わず、user_id条件付きの削除1発で
+    // 所有権チェックと削除をまとめる
+    const { data: deleted, error: deleteError } = await supabase
       .from("bookmarks")
-      .select("id, user_id")
+      .delete()
       .eq("id", params.id)
       .eq("user_id", session.user.id)
-      .single();
-
-    if (fetchError || !bookmark) {
-      return NextResponse.json({ error: "Bookmark not found" }, { status: 404 });
-    }
-
-    // ブックマーク削除
-    const { error: deleteError } = await supabase
-      .from("bookmarks")
-      .delete()
-      .eq("id", params.id);
+      .select("id");
 
     if (deleteError) {
       console.error("Bookmark deletion error:", deleteError);
       return NextResponse.json({ error: "Failed to delete bookmark" }, { status: 500 });
     }
 
+    if (!deleted || deleted.length === 0) {
+      return NextResponse.json({ error: "Bookmark not found" }, { status: 404 });
+    }
+
     return NextResponse.json({ success: true });
   } catch (error) {
     console.error("Unexpected error:", error);
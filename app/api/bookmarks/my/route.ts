@@ -24,10 +24,10 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: "Failed to fetch bookmarks" }, { status: 500 });
     }
 
-    // ブックマーク済みのpost_idのセットを返す
-    const bookmarkedPostIds = new Set(bookmarks?.map(b => b.post_id) || []);
+    // (user_id, post_id)はユニーク制約があるため重複排除は不要
+    const bookmarkedPostIds = bookmarks?.map(b => b.post_id) || [];
 
-    return NextResponse.json({ bookmarkedPostIds: Array.from(bookmarkedPostIds) });
+    return NextResponse.json({ bookmarkedPostIds });
 
   } catch (error) {
     console.error("Unexpected error:", error);
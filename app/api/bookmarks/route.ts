@@ -13,7 +13,7 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
 
-    const { searchParams } = new URL(request.url);
+    const { searchParams } = request.nextUrl;
     const isRead = searchParams.get("is_read");
     const postId = searchParams.get("post_id");
 
@@ -28,8 +28,7 @@ export async function GET(request: NextRequest) {
           id,
           title,
           url,
-          created_at,
-          metadata
+          created_at
         )
       `)
       .eq("user_id", session.user.id)
@@ -76,18 +75,8 @@ export async function POST(request: NextRequest) {
       return NextResponse.json({ error: "post_id is required" }, { status: 400 });
     }
 
-    // 投稿の存在確認
-    const { data: post, error: postError } = await supabase
-      .from("posts")
-      .select("id")
-      .eq("id", post_id)
-      .single();
-
-    if (postError || !post) {
-      return NextResponse.json({ error: "Post not found" }, { status: 404 });
-    }
-
     // ブックマーク作成
+    // 投稿の存在は事前クエリで確認せず、外部キー制約違反で判定する
     const { data: bookmark, error: insertError } = await supabase
       .from("bookmarks")
       .insert({
@@ -115,7 +104,12 @@ export async function POST(request: NextRequest) {
       if (insertError.code === '23505') {
         return NextResponse.json({ error: "この投稿は既にブックマークされています" }, { status: 409 });
       }
-      
+
+      // 外部キー違反 = 投稿が存在しない
+      if (insertError.code === '23503') {
+        return NextResponse.json({ error: "Post not found" }, { status: 404 });
+      }
+
       return NextResponse.json({ error: "Failed to create bookmark" }, { status: 500 });
     }
 
@@ -137,7 +131,7 @@ export async function DELETE(request: NextRequest) {
       return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
 
-    const { searchParams } = new URL(request.url);
+    const { searchParams } = request.nextUrl;
     const post_id = searchParams.get("post_id");
 
     if (!post_id) {
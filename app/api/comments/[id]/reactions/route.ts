@@ -37,15 +37,17 @@ export async function POST(
 
     // リアクション追加
     const currentReactions = comment.reactions || {};
-    const emojiUsers = currentReactions[emoji] || [];
-    
-    if (!emojiUsers.includes(session.user.id)) {
-      emojiUsers.push(session.user.id);
+    const emojiUsers: string[] = currentReactions[emoji] || [];
+
+    // リアクション済みなら更新クエリを発行せずそのまま返す
+    if (emojiUsers.includes(session.user.id)) {
+      return NextResponse.json({ reactions: currentReactions });
     }
 
+    // 取得した配列は変更せず、新しい配列を組み立てて更新する
     const updatedReactions = {
       ...currentReactions,
-      [emoji]: emojiUsers
+      [emoji]: [...emojiUsers, session.user.id]
     };
 
     const { data: updatedComment, error: updateError } = await supabase
@@ -101,20 +103,21 @@ export async function DELETE(
 
     // リアクション削除
     const currentReactions = comment.reactions || {};
-    const emojiUsers = currentReactions[emoji] || [];
-    const filteredUsers = emojiUsers.filter((userId: string) => userId !== session.user.id);
+    const emojiUsers: string[] = currentReactions[emoji] || [];
 
-    const updatedReactions = {
-      ...currentReactions,
-      [emoji]: filteredUsers.length > 0 ? filteredUsers : undefined
-    };
+    // リアクションしていなければ更新クエリを発行せずそのまま返す
+    if (!emojiUsers.includes(session.user.id)) {
+      return NextResponse.json({ reactions: currentReactions });
+    }
 
-    // 空のリアクションを削除
-    Object.keys(updatedReactions).forEach(emoji => {
-      if (!updatedReactions[emoji] || updatedReactions[emoji].length === 0) {
-        delete updatedReactions[emoji];
-      }
-    });
+    // 対象の絵文字だけ差し替え、空になったらキーごと落とす（全キー再走査はしない）
+    const filteredUsers = emojiUsers.filter((userId: string) => userId !== session.user.id);
+    const updatedReactions: Record<string, string[]> = { ...currentReactions };
+    if (filteredUsers.length > 0) {
+      updatedReactions[emoji] = filteredUsers;
+    } else {
+      delete updatedReactions[emoji];
+    }
 
     const { data: updatedComment, error: updateError } = await supabase
       .from("comments")
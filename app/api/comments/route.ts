@@ -1,8 +1,64 @@
 import { createRouteHandlerClient } from "@supabase/auth-helpers-nextjs";
 import { cookies } from "next/headers";
 import { NextRequest, NextResponse } from "next/server";
-import { CreateCommentRequest } from "@/lib/types/comments";
+import { Comment, CreateCommentRequest } from "@/lib/types/comments";
 import { sendCommentNotification } from "@/lib/slack/notification";
+import { env } from "@/lib/config/env";
+
+
+// コメント作成後のSlack通知。失敗してもコメント作成は成功扱いにするため
+// 呼び出し側でfire-and-forgetし、エラーはログのみ残す
+async function notifyCommentCreated(
+  supabase: ReturnType<typeof createRouteHandlerClient>,
+  post: { id: string; title: string; author_email: string | null; author_id: string },
+  commenterId: string,
+  parentId: string | null,
+  content: string
+) {
+  // 返信コメントの場合、元のコメント投稿者を特定
+  let parentAuthorId: string | null = null;
+  if (parentId) {
+    const { data: parentComment, error: parentCommentError } = await supabase
+      .from("comments")
+      .select("author_id")
+      .eq("id", parentId)
+      .single();
+
+    if (!parentCommentError && parentComment) {
+      parentAuthorId = parentComment.author_id;
+    }
+  }
+
+  // 必要なプロフィールは個別に引かず1クエリでまとめて取得
+  const profileIds = Array.from(
+    new Set([post.author_id, commenterId, parentAuthorId].filter(Boolean))
+  ) as string[];
+
+  const { data: profiles } = await supabase
+    .from("profiles")
+    .select("id, name, email")
+    .in("id", profileIds);
+
+  const profileMap = new Map(profiles?.map(profile => [profile.id, profile]) || []);
+  const postAuthor = profileMap.get(post.author_id);
+  const commentAuthor = profileMap.get(commenterId);
+  const parentAuthor = parentAuthorId ? profileMap.get(parentAuthorId) : null;
+
+  const authorName = commentAuthor?.name || commentAuthor?.email || "不明なユーザー";
+  const parentCommentAuthor = parentAuthor ? parentAuthor.name || parentAuthor.email : null;
+
+  await sendCommentNotification({
+    postTitle: post.title,
+    postUrl: `${env.siteUrl}/posts/${post.id}`,
+    commentAuthor: authorName,
+    commentContent: content,
+    postAuthorEmail: post.author_email || "不明",
+    postAuthorName: postAuthor?.name,
+    isReply: !!parentId,
+    parentCommentAuthor: parentCommentAuthor,
+    parentCommentAuthorEmail: parentAuthor?.email || null
+  });
+}
 
 export async function POST(request: NextRequest) {
   try {
@@ -23,10 +79,10 @@ export async function POST(request: NextRequest) {
       return NextResponse.json({ error: "Missing required fields" }, { status: 400 });
     }
 
-    // 投稿の存在確認
+    // 投稿の存在確認（通知に使うカラムもここで取得し、再取得しない）
     const { data: post, error: postError } = await supabase
       .from("posts")
-      .select("id")
+      .select("id, title, author_email, author_id")
       .eq("id", post_id)
       .single();
 
@@ -75,81 +131,10 @@ export async function POST(request: NextRequest) {
       return NextResponse.json({ error: "Failed to create comment" }, { status: 500 });
     }
 
-    // 投稿者にSlack通知を送信（非同期で実行）
-    try {
-      // 投稿情報と投稿者のプロフィール情報を取得
-      const { data: post, error: postError } = await supabase
-        .from("posts")
-        .select(`
-          title, 
-          author_email,
-          author_id
-        `)
-        .eq("id", post_id)
-        .single();
-
-      if (!postError && post) {
-        // 投稿者のプロフィール情報を取得
-        const { data: postAuthor, error: postAuthorError } = await supabase
-          .from("profiles")
-          .select("name, email")
-          .eq("id", post.author_id)
-          .single();
-
-        // コメント投稿者の情報を取得
-        const { data: commentAuthor, error: authorError } = await supabase
-          .from("profiles")
-          .select("name, email")
-          .eq("id", session.user.id)
-          .single();
-
-        const authorName = commentAuthor?.name || commentAuthor?.email || "不明なユーザー";
-        const postUrl = `${process.env.NEXT_PUBLIC_SITE_URL || 'http://localhost:3000'}/posts/${post_id}`;
-
-        // 返信コメントの場合、元のコメント投稿者の情報を取得
-        let parentCommentAuthor = null;
-        let parentCommentAuthorEmail = null;
-        
-        if (parent_id) {
-          const { data: parentComment, error: parentCommentError } = await supabase
-            .from("comments")
-            .select("author_id")
-            .eq("id", parent_id)
-            .single();
-
-          if (!parentCommentError && parentComment) {
-            const { data: parentAuthor, error: parentAuthorError } = await supabase
-              .from("profiles")
-              .select("name, email")
-              .eq("id", parentComment.author_id)
-              .single();
-
-            if (!parentAuthorError && parentAuthor) {
-              parentCommentAuthor = parentAuthor.name || parentAuthor.email;
-              parentCommentAuthorEmail = parentAuthor.email;
-            }
-          }
-        }
-
-        // Slack通知を送信（非同期で実行、エラーはログのみ）
-        sendCommentNotification({
-          postTitle: post.title,
-          postUrl: postUrl,
-          commentAuthor: authorName,
-          commentContent: content,
-          postAuthorEmail: post.author_email || "不明",
-          postAuthorName: postAuthor?.name,
-          isReply: !!parent_id,
-          parentCommentAuthor: parentCommentAuthor,
-          parentCommentAuthorEmail: parentCommentAuthorEmail
-        }).catch(error => {
-          console.error("Failed to send Slack notification:", error);
-        });
-      }
-    } catch (notificationError) {
-      console.error("Error preparing Slack notification:", notificationError);
-      // 通知エラーはコメント作成を阻害しない
-    }
+    // 投稿者へのSlack通知はレスポンスを待たせずに実行し、エラーはログのみ
+    notifyCommentCreated(supabase, post, session.user.id, parent_id || null, content).catch(error => {
+      console.error("Failed to send Slack notification:", error);
+    });
 
     return NextResponse.json({ comment }, { status: 201 });
   } catch (error) {
@@ -169,7 +154,7 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
 
-    const { searchParams } = new URL(request.url);
+    const { searchParams } = request.nextUrl;
     const post_id = searchParams.get("post_id");
 
     if (!post_id) {
@@ -197,8 +182,13 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: "Failed to fetch comments" }, { status: 500 });
     }
 
-        // プロフィール情報を取得
-        const authorIds = Array.from(new Set(comments?.map(c => c.author_id) || []));
+    // コメントがなければプロフィール取得もツリー構築も不要
+    if (!comments || comments.length === 0) {
+      return NextResponse.json({ comments: [] });
+    }
+
+    // プロフィール情報を取得
+    const authorIds = Array.from(new Set(comments.map(c => c.author_id)));
     const { data: profiles, error: profilesError } = await supabase
       .from("profiles")
       .select("id, name, email")
@@ -214,28 +204,23 @@ export async function GET(request: NextRequest) {
       profileMap.set(profile.id, profile);
     });
 
-    // コメントにプロフィール情報を追加
-    const commentsWithProfiles = comments?.map(comment => ({
-      ...comment,
-      author: profileMap.get(comment.author_id) || null
-    })) || [];
-
     // 階層構造に変換
-    const commentMap = new Map();
-    const rootComments: any[] = [];
-
-    commentsWithProfiles.forEach(comment => {
-      (comment as any).replies = [];
-      (comment as any).reply_count = 0;
+    // created_at昇順で取得しているため親コメントは必ず子より先に現れる。
+    // 中間配列を作らず1パスでプロフィール付与とツリー構築を行う
+    const commentMap = new Map<string, Comment>();
+    const rootComments: Comment[] = [];
+
+    (comments as Comment[]).forEach(comment => {
+      comment.author = profileMap.get(comment.author_id) || null;
+      comment.replies = [];
+      comment.reply_count = 0;
       commentMap.set(comment.id, comment);
-    });
 
-    commentsWithProfiles.forEach(comment => {
       if (comment.parent_id) {
         const parent = commentMap.get(comment.parent_id);
         if (parent) {
-          (parent as any).replies.push(comment);
-          (parent as any).reply_count = ((parent as any).reply_count || 0) + 1;
+          parent.replies!.push(comment);
+          parent.reply_count = (parent.reply_count || 0) + 1;
         }
       } else {
         rootComments.push(comment);
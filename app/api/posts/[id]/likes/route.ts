@@ -15,25 +15,28 @@ export async function GET(
       return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
 
-    // いいね数を取得
-    const { count: likeCount, error: countError } = await supabase
-      .from("post_likes")
-      .select("*", { count: "exact", head: true })
-      .eq("post_id", params.id);
+    // いいね数とユーザーのいいね有無は独立したクエリなので並列で取得
+    const [
+      { count: likeCount, error: countError },
+      { data: userLike, error: userLikeError }
+    ] = await Promise.all([
+      supabase
+        .from("post_likes")
+        .select("*", { count: "exact", head: true })
+        .eq("post_id", params.id),
+      supabase
+        .from("post_likes")
+        .select("id")
+        .eq("post_id", params.id)
+        .eq("user_id", session.user.id)
+        .single()
+    ]);
 
     if (countError) {
       console.error("Failed to fetch like count:", countError);
       return NextResponse.json({ error: "Failed to fetch like count" }, { status: 500 });
     }
 
-    // ユーザーがいいねしているかチェック
-    const { data: userLike, error: userLikeError } = await supabase
-      .from("post_likes")
-      .select("id")
-      .eq("post_id", params.id)
-      .eq("user_id", session.user.id)
-      .single();
-
     if (userLikeError && userLikeError.code !== "PGRST116") {
       console.error("Failed to check user like:", userLikeError);
       return NextResponse.json({ error: "Failed to check user like" }, { status: 500 });
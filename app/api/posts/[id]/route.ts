@@ -1,6 +1,7 @@
 import { createRouteHandlerClient } from "@supabase/auth-helpers-nextjs";
 import { cookies } from "next/headers";
 import { NextRequest, NextResponse } from "next/server";
+import { upsertPostTags } from "@/lib/posts/tags";
 
 export async function DELETE(
   request: NextRequest,
@@ -22,10 +23,16 @@ export async function DELETE(
     const postId = params.id;
     const forceDelete = request.headers.get("X-Force-Delete") === "true";
 
-    // 投稿の所有者を確認
+    // 所有者確認と関連データ件数を1クエリでまとめて取得
     const { data: post, error: postError } = await supabase
       .from("posts")
-      .select("id, author_id, title")
+      .select(`
+        id,
+        author_id,
+        title,
+        comments(count),
+        bookmarks(count)
+      `)
       .eq("id", postId)
       .single();
 
@@ -39,22 +46,8 @@ export async function DELETE(
 
     // 強制削除でない場合は関連データの存在確認
     if (!forceDelete) {
-      const { data: relatedData, error: relatedError } = await supabase
-        .from("posts")
-        .select(`
-          comments(count),
-          bookmarks(count)
-        `)
-        .eq("id", postId)
-        .single();
-
-      if (relatedError) {
-        console.error("Failed to check related data:", relatedError);
-        return NextResponse.json({ error: "Failed to check related data" }, { status: 500 });
-      }
-
-      const commentCount = relatedData?.comments?.[0]?.count || 0;
-      const bookmarkCount = relatedData?.bookmarks?.[0]?.count || 0;
+      const commentCount = post.comments?.[0]?.count || 0;
+      const bookmarkCount = post.bookmarks?.[0]?.count || 0;
 
       // 関連データがある場合は警告メッセージを返す
       if (commentCount > 0 || bookmarkCount > 0) {
@@ -114,7 +107,10 @@ export async function PUT(
     const body = await request.json();
     const { title, url, content, tags = [] } = body;
 
-    if (!title?.trim() || !url?.trim()) {
+    const trimmedTitle = title?.trim();
+    const trimmedUrl = url?.trim();
+
+    if (!trimmedTitle || !trimmedUrl) {
       return NextResponse.json({ error: "Title and url are required" }, { status: 400 });
     }
 
@@ -134,11 +130,11 @@ export async function PUT(
     }
 
     // URLが変更された場合の重複チェック
-    if (post.url !== url.trim()) {
+    if (post.url !== trimmedUrl) {
       const { data: existingPost, error: checkError } = await supabase
         .from("posts")
         .select("id, title, author_email, created_at")
-        .eq("url", url.trim())
+        .eq("url", trimmedUrl)
         .neq("id", postId)
         .single();
 
@@ -165,8 +161,8 @@ export async function PUT(
     const { data: updatedPost, error: updateError } = await supabase
       .from("posts")
       .update({
-        title: title.trim(),
-        url: url.trim(),
+        title: trimmedTitle,
+        url: trimmedUrl,
         content: content?.trim() ?? null,
         updated_at: new Date().toISOString()
       })
@@ -181,36 +177,13 @@ export async function PUT(
 
     // タグの更新
     if (tags.length > 0) {
-      // 既存のタグを削除
+      // 既存のタグを削除してから共有ヘルパーで再登録
       await supabase
         .from("post_tags")
         .delete()
         .eq("post_id", postId);
 
-      // 新しいタグを追加
-      const tagPayload = tags.map((tagName: string) => ({
-        name: tagName,
-        description: null
-      }));
-
-      const { data: upsertedTags, error: tagError } = await supabase
-        .from("tags")
-        .upsert(tagPayload, { onConflict: "name" })
-        .select("id, name");
-
-      if (tagError) {
-        console.error("Tag upsert failed:", tagError);
-      } else if (upsertedTags) {
-        const postTagsPayload = upsertedTags.map((tag) => ({
-          post_id: postId,
-          tag_id: tag.id
-        }));
-
-        const { error: postTagsError } = await supabase.from("post_tags").upsert(postTagsPayload);
-        if (postTagsError) {
-          console.error("Post tags upsert failed:", postTagsError);
-        }
-      }
+      await upsertPostTags(supabase, postId, tags);
     }
 
     return NextResponse.json({ post: updatedPost });
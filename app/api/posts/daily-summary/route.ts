@@ -14,14 +14,24 @@ interface DailyPost {
   };
 }
 
+// 認証情報は固定なのでリクエストごとに生成せず使い回す。
+// env未設定時はimport時に落とさずnullにして、ハンドラー側で500を返す
+const supabase = env.supabaseUrl && env.supabaseAnonKey
+  ? createClient(env.supabaseUrl, env.supabaseAnonKey)
+  : null;
+
 export async function GET(request: NextRequest) {
   try {
-    const supabase = createClient(env.supabaseUrl, env.supabaseAnonKey);
-    
+    if (!supabase) {
+      console.error('Supabase client is not configured.');
+      return NextResponse.json({ error: 'Internal server error' }, { status: 500 });
+    }
+
     // 過去24時間の新規投稿を取得
     const yesterday = new Date();
     yesterday.setDate(yesterday.getDate() - 1);
     
+    // RSS投稿の除外はDB側で行い、不要な行とmetadataカラムを転送しない
     const { data: posts, error } = await supabase
       .from('posts')
       .select(`
@@ -30,13 +40,13 @@ export async function GET(request: NextRequest) {
         url,
         author_id,
         created_at,
-        metadata,
         profiles!posts_author_id_fkey (
           name,
           email
         )
       `)
       .gte('created_at', yesterday.toISOString())
+      .or('metadata->>source.is.null,metadata->>source.neq.rss')
       .order('created_at', { ascending: false });
 
     if (error) {
@@ -44,10 +54,7 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: 'Failed to fetch posts' }, { status: 500 });
     }
 
-    // ユーザー投稿のみをフィルタリング（RSS投稿を除外）
-    const userPosts = posts?.filter(post => 
-      post.metadata?.source !== 'rss'
-    ) || [];
+    const userPosts = posts || [];
 
     return NextResponse.json({
       posts: userPosts,
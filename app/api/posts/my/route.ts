@@ -40,15 +40,15 @@ export async function GET(request: NextRequest) {
     }
 
     // コメント数とブックマーク数を計算
-    const postsWithCounts = posts?.map(post => ({
-      ...post,
-      _count: {
+    // レスポンス用の一時オブジェクトなので、行ごとにコピーせずそのまま書き足す
+    posts?.forEach(post => {
+      (post as any)._count = {
         comments: post.comments?.[0]?.count || 0,
         bookmarks: post.bookmarks?.[0]?.count || 0
-      }
-    })) || [];
+      };
+    });
 
-    return NextResponse.json({ posts: postsWithCounts });
+    return NextResponse.json({ posts: posts || [] });
   } catch (error) {
     console.error("Unexpected error while fetching my posts:", error);
     return NextResponse.json({ error: "Internal server error" }, { status: 500 });
@@ -3,6 +3,31 @@ import { cookies } from "next/headers";
 import { NextRequest, NextResponse } from "next/server";
 import type { CreatePostRequest } from "@/lib/types/posts";
 import { sendPostNotification } from "@/lib/slack/notification";
+import { upsertPostTags } from "@/lib/posts/tags";
+
+
+// 投稿作成後のSlack通知。レスポンスを待たせないよう呼び出し側で
+// fire-and-forgetし、失敗はログのみ残す
+async function notifyPostCreated(
+  supabase: ReturnType<typeof createRouteHandlerClient>,
+  post: { id: string; title: string; url: string; content: string | null },
+  user: { id: string; email?: string; user_metadata?: { name?: string } }
+) {
+  const { data: profile } = await supabase
+    .from("profiles")
+    .select("name, email")
+    .eq("id", user.id)
+    .single();
+
+  await sendPostNotification({
+    postId: post.id,
+    title: post.title,
+    url: post.url,
+    authorName: profile?.name || user.user_metadata?.name || "Unknown",
+    authorEmail: user.email || "",
+    content: post.content || undefined
+  });
+}
 
 export async function POST(request: NextRequest) {
   try {
@@ -21,7 +46,10 @@ export async function POST(request: NextRequest) {
     const body: CreatePostRequest = await request.json();
     const { title, url, content, tags = [] } = body;
 
-    if (!title?.trim() || !url?.trim()) {
+    const trimmedTitle = title?.trim();
+    const trimmedUrl = url?.trim();
+
+    if (!trimmedTitle || !trimmedUrl) {
       return NextResponse.json({ error: "Title and url are required" }, { status: 400 });
     }
 
@@ -29,7 +57,7 @@ export async function POST(request: NextRequest) {
     const { data: existingPost, error: checkError } = await supabase
       .from("posts")
       .select("id, title, author_email, created_at")
-      .eq("url", url.trim())
+      .eq("url", trimmedUrl)
       .single();
 
     if (checkError && checkError.code !== "PGRST116") {
@@ -57,8 +85,8 @@ export async function POST(request: NextRequest) {
       .insert({
         author_id: session.user.id,
         author_email: session.user.email,
-        title: title.trim(),
-        url: url.trim(),
+        title: trimmedTitle,
+        url: trimmedUrl,
         content: content?.trim() ?? null,
         metadata: { source: "manual" }
       })
@@ -72,54 +100,14 @@ export async function POST(request: NextRequest) {
       return NextResponse.json({ error: "Failed to create post" }, { status: 500 });
     }
 
-    if (tags.length > 0) {
-      const tagPayload = tags.map((tagName) => ({
-        name: tagName,
-        description: null
-      }));
-
-      const { data: upsertedTags, error: tagError } = await supabase
-        .from("tags")
-        .upsert(tagPayload, { onConflict: "name" })
-        .select("id, name");
-
-      if (tagError) {
-        console.error("Tag upsert failed", tagError);
-      } else if (upsertedTags) {
-        const postTagsPayload = upsertedTags.map((tag) => ({
-          post_id: post.id,
-          tag_id: tag.id
-        }));
-
-        const { error: postTagsError } = await supabase.from("post_tags").upsert(postTagsPayload);
-        if (postTagsError) {
-          console.error("Post tags upsert failed", postTagsError);
-        }
-      }
-    }
+    await upsertPostTags(supabase, post.id, tags);
 
     // ユーザー投稿の場合のみSlack通知を送信（RSS投稿は除外）
+    // 通知の失敗は投稿作成を阻害しないため、レスポンスを待たせずに実行する
     if (post.metadata?.source !== "rss") {
-      try {
-        // ユーザー情報を取得
-        const { data: profile } = await supabase
-          .from("profiles")
-          .select("name, email")
-          .eq("id", session.user.id)
-          .single();
-
-        await sendPostNotification({
-          postId: post.id,
-          title: post.title,
-          url: post.url,
-          authorName: profile?.name || session.user.user_metadata?.name || "Unknown",
-          authorEmail: session.user.email || "",
-          content: post.content || undefined
-        });
-      } catch (notificationError) {
-        // Slack通知の失敗は投稿作成を阻害しない
+      notifyPostCreated(supabase, post, session.user).catch(notificationError => {
         console.error("Failed to send post notification:", notificationError);
-      }
+      });
     }
 
     return NextResponse.json({ post }, { status: 201 });
@@ -148,11 +136,14 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
 
-    const { searchParams } = new URL(request.url);
+    const { searchParams } = request.nextUrl;
     const tag = searchParams.get("tag");
     const source = searchParams.get("source");
-    const page = parseInt(searchParams.get("page") || "1", 10);
-    const limit = parseInt(searchParams.get("limit") || "10", 10);
+    // 不正値や極端な値で巨大なrangeを投げないよう正規化する
+    const rawPage = parseInt(searchParams.get("page") || "1", 10);
+    const rawLimit = parseInt(searchParams.get("limit") || "10", 10);
+    const page = Number.isNaN(rawPage) ? 1 : Math.max(rawPage, 1);
+    const limit = Number.isNaN(rawLimit) ? 10 : Math.min(Math.max(rawLimit, 1), 100);
     const offset = (page - 1) * limit;
 
     // まず基本的なクエリを構築
@@ -177,30 +168,18 @@ export async function GET(request: NextRequest) {
 
     // フィルタ条件を適用
     if (tag) {
-      // タグフィルタの場合は、post_tagsテーブルを経由してフィルタリング
-      // まずタグIDを取得
-      const { data: tagData, error: tagError } = await supabase
-        .from("tags")
-        .select("id")
-        .eq("name", tag)
-        .single();
-      
-      if (tagError) {
-        console.error("Failed to find tag:", tagError);
-        return NextResponse.json({ error: "Tag not found" }, { status: 404 });
-      }
-      
-      // タグに関連する投稿IDを取得
+      // タグ名での絞り込みはtags→post_tagsの2段クエリをやめ、
+      // post_tagsにタグ名でinner joinした1クエリで投稿IDを引く
       const { data: postTags, error: postTagsError } = await supabase
         .from("post_tags")
-        .select("post_id")
-        .eq("tag_id", tagData.id);
-      
+        .select("post_id, tags!inner(name)")
+        .eq("tags.name", tag);
+
       if (postTagsError) {
         console.error("Failed to fetch post tags:", postTagsError);
         return NextResponse.json({ error: "Failed to fetch posts with tag" }, { status: 500 });
       }
-      
+
       const postIds = postTags?.map(pt => pt.post_id) || [];
       if (postIds.length === 0) {
         return NextResponse.json({ 
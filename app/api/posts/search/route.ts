@@ -16,7 +16,7 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
 
-    const { searchParams } = new URL(request.url);
+    const { searchParams } = request.nextUrl;
     const query = searchParams.get("q");
     const tag = searchParams.get("tag");
     const source = searchParams.get("source");
@@ -60,31 +60,42 @@ export async function GET(request: NextRequest) {
       supabaseQuery = supabaseQuery.eq("metadata->>source", "rss");
     }
 
-    const { data: posts, error: fetchError } = await supabaseQuery;
+    // 総件数クエリ（ページネーション用）。count=falseの場合は
+    // 全件走査になるCOUNTを発行しない
+    const includeCount = searchParams.get("count") !== "false";
+
+    let countQuery = null;
+    if (includeCount) {
+      countQuery = supabase
+        .from("posts")
+        .select("id", { count: "exact", head: true })
+        .or(`title.ilike.%${query}%,content.ilike.%${query}%`);
+
+      if (tag) {
+        countQuery = countQuery.contains("post_tags", [{ tag: { name: tag } }]);
+      }
+
+      if (source === "manual") {
+        countQuery = countQuery.or("metadata->>source.is.null,metadata->>source.neq.rss");
+      } else if (source === "rss") {
+        countQuery = countQuery.eq("metadata->>source", "rss");
+      }
+    }
+
+    // 検索結果と総件数は独立しているので並行して実行する
+    const [
+      { data: posts, error: fetchError },
+      { count, error: countError }
+    ] = await Promise.all([
+      supabaseQuery,
+      countQuery ?? Promise.resolve({ count: null, error: null })
+    ]);
 
     if (fetchError) {
       console.error("Failed to search posts:", fetchError);
       return NextResponse.json({ error: "Failed to search posts" }, { status: 500 });
     }
 
-    // 総件数を取得（ページネーション用）
-    let countQuery = supabase
-      .from("posts")
-      .select("id", { count: "exact", head: true })
-      .or(`title.ilike.%${query}%,content.ilike.%${query}%`);
-
-    if (tag) {
-      countQuery = countQuery.contains("post_tags", [{ tag: { name: tag } }]);
-    }
-
-    if (source === "manual") {
-      countQuery = countQuery.or("metadata->>source.is.null,metadata->>source.neq.rss");
-    } else if (source === "rss") {
-      countQuery = countQuery.eq("metadata->>source", "rss");
-    }
-
-    const { count, error: countError } = await countQuery;
-
     if (countError) {
       console.error("Failed to get search count:", countError);
     }
@@ -2,6 +2,13 @@ import { createRouteHandlerClient } from "@supabase/auth-helpers-nextjs";
 import { cookies } from "next/headers";
 import { NextRequest, NextResponse } from "next/server";
 
+// 期間フィルターの条件（リクエストごとに組み立てずテーブル参照する）
+const PERIOD_FILTERS: Record<string, string> = {
+  day: "AND p.created_at >= NOW() - INTERVAL '1 day'",
+  week: "AND p.created_at >= NOW() - INTERVAL '1 week'",
+  month: "AND p.created_at >= NOW() - INTERVAL '1 month'"
+};
+
 export async function GET(request: NextRequest) {
   try {
     const cookieStore = cookies();
@@ -13,47 +20,38 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
 
-    const { searchParams } = new URL(request.url);
+    const { searchParams } = request.nextUrl;
     const period = searchParams.get("period") || "all"; // all, day, week, month
     const page = parseInt(searchParams.get("page") || "1");
     const limit = parseInt(searchParams.get("limit") || "20");
     const offset = (page - 1) * limit;
+    // サイドバー等、件数不要の呼び出しはcount=falseで件数RPCを省略できる
+    const includeCount = searchParams.get("count") !== "false";
 
-    // 期間フィルターの条件を設定
-    let dateFilter = "";
-    switch (period) {
-      case "day":
-        dateFilter = "AND p.created_at >= NOW() - INTERVAL '1 day'";
-        break;
-      case "week":
-        dateFilter = "AND p.created_at >= NOW() - INTERVAL '1 week'";
-        break;
-      case "month":
-        dateFilter = "AND p.created_at >= NOW() - INTERVAL '1 month'";
-        break;
-      default:
-        dateFilter = "";
-    }
+    const dateFilter = PERIOD_FILTERS[period] ?? "";
 
-    // コメント数ランキングを取得するクエリ
-    const { data: rankings, error: rankingsError } = await supabase
-      .rpc('get_comment_rankings', {
+    // コメント数ランキングを取得するクエリ（件数取得と独立なので並行実行する）
+    const [
+      { data: rankings, error: rankingsError },
+      { data: totalCount, error: countError }
+    ] = await Promise.all([
+      supabase.rpc('get_comment_rankings', {
         period_filter: dateFilter,
         limit_count: limit,
         offset_count: offset
-      });
+      }),
+      includeCount
+        ? supabase.rpc('get_comment_rankings_count', {
+            period_filter: dateFilter
+          })
+        : Promise.resolve({ data: null, error: null })
+    ]);
 
     if (rankingsError) {
       console.error("Comment rankings query error:", rankingsError);
       return NextResponse.json({ error: "Failed to fetch comment rankings" }, { status: 500 });
     }
 
-    // 総件数を取得
-    const { data: totalCount, error: countError } = await supabase
-      .rpc('get_comment_rankings_count', {
-        period_filter: dateFilter
-      });
-
     if (countError) {
       console.error("Comment rankings count error:", countError);
       return NextResponse.json({ error: "Failed to fetch comment rankings count" }, { status: 500 });
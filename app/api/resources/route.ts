@@ -12,6 +12,20 @@ interface ResourceLinkPayload {
   }[];
 }
 
+// POST/PATCHで共通のバリデーション+行変換を1パスで行う
+const buildInsertRows = (userId: string, links: ResourceLinkPayload["links"]) =>
+  links.map((link) => {
+    const service = link.service.trim().toLowerCase();
+    if (!SUPPORTED_SERVICES.has(service)) {
+      throw new Error(`Unsupported service: ${service}`);
+    }
+    return {
+      user_id: userId,
+      label: service,
+      url: link.url.trim()
+    };
+  });
+
 const formatLink = (row: any) => ({
   id: row.id,
   user_id: row.user_id,
@@ -96,19 +110,9 @@ export async function POST(request: NextRequest) {
     return NextResponse.json({ error: "user not found" }, { status: 404 });
   }
 
-  const insertRows = links.map((link) => {
-    const service = link.service.trim().toLowerCase();
-    if (!SUPPORTED_SERVICES.has(service)) {
-      throw new Error(`Unsupported service: ${service}`);
-    }
-    return {
-      user_id: body.user_id,
-      label: service,
-      url: link.url.trim()
-    };
-  });
-
   try {
+    const insertRows = buildInsertRows(body.user_id, links);
+
     const { data, error } = await supabase
       .from("resource_links")
       .insert(insertRows)
@@ -183,17 +187,7 @@ export async function PATCH(request: NextRequest) {
   }
 
   try {
-    const prepared = links.map((link) => {
-      const service = link.service.trim().toLowerCase();
-      if (!SUPPORTED_SERVICES.has(service)) {
-        throw new Error(`Unsupported service: ${service}`);
-      }
-      return {
-        user_id: body.user_id,
-        label: service,
-        url: link.url.trim()
-      };
-    });
+    const prepared = buildInsertRows(body.user_id, links);
 
     const { data: updated, error: insertError } = await supabase
       .from("resource_links")
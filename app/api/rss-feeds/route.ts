@@ -131,6 +131,11 @@ export async function PATCH(request: NextRequest) {
   if (body.tags !== undefined) updates.tags = normalizeTags(body.tags);
   if (body.is_active !== undefined) updates.is_active = body.is_active;
 
+  // 更新対象がなければDBに空のUPDATEを投げない
+  if (Object.keys(updates).length === 0) {
+    return NextResponse.json({ error: "No fields to update" }, { status: 400 });
+  }
+
   const { data, error } = await supabase
     .from("rss_feeds")
     .update(updates)
@@ -158,8 +163,7 @@ export async function DELETE(request: NextRequest) {
     return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
   }
 
-  const url = new URL(request.url);
-  const feedId = url.searchParams.get("id");
+  const feedId = request.nextUrl.searchParams.get("id");
 
   if (!feedId) {
     return NextResponse.json({ error: "id is required" }, { status: 400 });
@@ -1,14 +1,25 @@
 import { createClient } from "@supabase/supabase-js";
 import { NextResponse } from "next/server";
 
+// ビルド時に静的化してDBへ接続しないよう動的ルートのまま、
+// cookie非依存のクエリ結果はCDN側で短TTLキャッシュさせる
 export const dynamic = "force-dynamic";
 
+// リクエストごとに生成せずモジュールスコープで使い回す（認証情報は固定のため）。
+// env未設定時はimport時に落とさずnullにして、ハンドラー側で500を返す
+const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
+const supabaseServiceRoleKey = process.env.SUPABASE_SERVICE_ROLE_KEY;
+
+const supabase = supabaseUrl && supabaseServiceRoleKey
+  ? createClient(supabaseUrl, supabaseServiceRoleKey)
+  : null;
+
 export async function GET() {
   try {
-    const supabase = createClient(
-      process.env.NEXT_PUBLIC_SUPABASE_URL!,
-      process.env.SUPABASE_SERVICE_ROLE_KEY!
-    );
+    if (!supabase) {
+      console.error("Supabase service role client is not configured.");
+      return NextResponse.json({ error: "Internal server error" }, { status: 500 });
+    }
 
     const { data: tags, error } = await supabase
       .from("tags")
@@ -20,7 +31,9 @@ export async function GET() {
       return NextResponse.json({ error: "Failed to fetch tags" }, { status: 500 });
     }
 
-    return NextResponse.json(tags?.map(tag => tag.name) || []);
+    return NextResponse.json(tags?.map(tag => tag.name) || [], {
+      headers: { "Cache-Control": "public, s-maxage=60, stale-while-revalidate=60" }
+    });
   } catch (error) {
     console.error("Error in tags API:", error);
     return NextResponse.json({ error: "Internal server error" }, { status: 500 });
@@ -4,6 +4,12 @@ import { createClientComponentClient } from "@supabase/auth-helpers-nextjs";
 import { useRouter, useSearchParams } from "next/navigation";
 import { useEffect } from "react";
 
+// デバッグログは本番では組み立てごと省く（セッション情報を含むため）
+const isDev = process.env.NODE_ENV !== "production";
+const debugLog = (...args: unknown[]) => {
+  if (isDev) console.log("[AuthCallback]", ...args);
+};
+
 export default function AuthCallback() {
   const router = useRouter();
   const searchParams = useSearchParams();
@@ -14,14 +20,13 @@ export default function AuthCallback() {
       const supabase = createClientComponentClient();
       
       try {
-        // デバッグ用ログ
-        console.log("[AuthCallback] Starting authentication callback");
-        console.log("[AuthCallback] Current URL:", window.location.href);
+        debugLog("Starting authentication callback");
+        debugLog("Current URL:", window.location.href);
         
         // OAuth認証の場合は、URLハッシュから認証情報を処理
         const { data, error } = await supabase.auth.getSession();
         
-        console.log("[AuthCallback] Session data:", { data, error });
+        debugLog("Session data:", { data, error });
         
         if (error) {
           console.error("Auth callback error:", error);
@@ -30,12 +35,12 @@ export default function AuthCallback() {
         }
 
         if (data.session) {
-          console.log("[AuthCallback] Session found, checking user info");
+          debugLog("Session found, checking user info");
           
           // セッションが存在する場合、ユーザー情報も確認
           const { data: { user }, error: userError } = await supabase.auth.getUser();
           
-          console.log("[AuthCallback] User data:", { user, userError });
+          debugLog("User data:", { user, userError });
           
           if (userError) {
             console.error("User fetch error:", userError);
@@ -44,18 +49,18 @@ export default function AuthCallback() {
           }
 
           if (user) {
-            console.log("[AuthCallback] Login successful, redirecting to:", redirectTo);
+            debugLog("Login successful, redirecting to:", redirectTo);
             // ログイン成功 - 少し待ってからリダイレクト
             setTimeout(() => {
               router.push(redirectTo);
             }, 100);
           } else {
-            console.log("[AuthCallback] No user found");
+            debugLog("No user found");
             // ユーザー情報が取得できない
             router.push("/login?error=no_session");
           }
         } else {
-          console.log("[AuthCallback] No session found");
+          debugLog("No session found");
           // セッションが見つからない
           router.push("/login?error=no_session");
         }
@@ -10,10 +10,17 @@ import PostSearch from "@/components/posts/PostSearch";
 import PostEditor from "@/components/PostEditor";
 import RankingSidebar from "@/components/rankings/RankingSidebar";
 import { useInfiniteScroll } from "@/hooks/useInfiniteScroll";
-import { Metadata } from "next";
 
 type SourceFilter = "all" | "manual" | "rss";
 
+const SOURCE_FILTERS: SourceFilter[] = ["all", "manual", "rss"];
+
+const SOURCE_LABELS: Record<SourceFilter, string> = {
+  all: "すべて",
+  manual: "ユーザー投稿",
+  rss: "RSS投稿"
+};
+
 interface PostWithTags extends Post {
   post_tags?: { tag: { id: string; name: string } }[];
   comments?: { count: number }[];
@@ -50,15 +57,11 @@ async function fetchPosts(params: {
   return { posts: posts as PostWithTags[], pagination };
 }
 
-function deriveTags(posts: PostWithTags[]) {
-  const tags = new Set<string>();
-  posts.forEach((post) => post.post_tags?.forEach((item) => tags.add(item.tag.name)));
-  return Array.from(tags).sort();
-}
-
 function createExcerpt(text: string, maxLength = 200) {
-  const normalized = text.replace(/\r\n/g, "\n").trim();
-  if (normalized.length <= maxLength) {
+  // 長い本文は全体を正規化せず、抜粋に必要な先頭部分だけを処理する
+  const source = text.length > maxLength * 2 ? text.slice(0, maxLength * 2) : text;
+  const normalized = source.replace(/\r\n/g, "\n").trim();
+  if (source === text && normalized.length <= maxLength) {
     return normalized;
   }
 
@@ -93,6 +96,8 @@ export default function HomePage() {
     total: 0
   });
   const hasLoadedOnceRef = useRef(false);
+  const hasLoadedTagsRef = useRef(false);
+  const hasLoadedUserDataRef = useRef(false);
 
   useEffect(() => {
     if (!isSessionLoading && !session) {
@@ -125,11 +130,14 @@ export default function HomePage() {
   };
 
   const fetchAvailableTags = async () => {
+    // タグ一覧はフィルタ操作では変わらないため、取得は初回のみ
+    if (hasLoadedTagsRef.current) return;
     try {
       const response = await fetch("/api/tags");
       if (response.ok) {
         const tags = await response.json();
         setAvailableTags(tags);
+        hasLoadedTagsRef.current = true;
       }
     } catch (err) {
       console.error("Failed to load tags:", err);
@@ -145,24 +153,33 @@ export default function HomePage() {
     }
     
     try {
-      const { posts: newPosts, pagination: newPagination } = await fetchPosts({
-        source,
-        tag: tag || undefined,
-        page: reset ? 1 : pagination.page + 1,
-        limit: 10
-      });
-      
       if (reset) {
+        // 投稿・ブックマーク・いいね・タグは互いに独立なのですべて並行で取得。
+        // ブックマーク・いいねはユーザー単位でフィルタと無関係なので初回のみ
+        const shouldLoadUserData = !hasLoadedUserDataRef.current;
+        const [{ posts: newPosts, pagination: newPagination }] = await Promise.all([
+          fetchPosts({ source, tag: tag || undefined, page: 1, limit: 10 }),
+          shouldLoadUserData ? loadBookmarks() : Promise.resolve(),
+          shouldLoadUserData ? loadLikes() : Promise.resolve(),
+          fetchAvailableTags()
+        ]);
+        hasLoadedUserDataRef.current = true;
+
         setPosts(newPosts);
         setPagination({
           page: 1,
           hasMore: newPagination.hasMore,
           total: newPagination.total
         });
-        // ブックマーク一覧といいね一覧、タグ一覧も同時に取得
-        await Promise.all([loadBookmarks(), loadLikes(), fetchAvailableTags()]);
         setIsInitialLoad(false);
       } else {
+        const { posts: newPosts, pagination: newPagination } = await fetchPosts({
+          source,
+          tag: tag || undefined,
+          page: pagination.page + 1,
+          limit: 10
+        });
+
         setPosts(prev => [...prev, ...newPosts]);
         setPagination(prev => ({
           ...prev,
@@ -271,6 +288,17 @@ export default function HomePage() {
     return posts;
   }, [posts, searchQuery, searchResults]);
 
+  // 抜粋の生成は文字列走査を伴うため、レンダーごとに全件分やり直さない
+  const displayItems = useMemo(
+    () =>
+      displayPosts.map((post) => ({
+        post,
+        excerpt: post.content ? createExcerpt(post.content, 120) : null,
+        formattedDate: new Date(post.created_at).toLocaleString("ja-JP")
+      })),
+    [displayPosts]
+  );
+
   // 無限スクロールの設定
   const { loadMoreRef } = useInfiniteScroll({
     hasMore: pagination.hasMore && !isSearching,
@@ -348,15 +376,15 @@ export default function HomePage() {
               </div>
               
               <div className="mt-4 flex flex-wrap gap-3 text-sm">
-                {["all", "manual", "rss"].map((key) => (
+                {SOURCE_FILTERS.map((key) => (
                   <button
                     key={key}
-                    onClick={() => setSource(key as SourceFilter)}
+                    onClick={() => setSource(key)}
                     className={`rounded-full px-3 py-1 transition ${
                       source === key ? "bg-blue-600 text-white shadow" : "bg-gray-100 text-gray-600 hover:bg-gray-200"
                     }`}
                   >
-                    {key === "all" ? "すべて" : key === "manual" ? "ユーザー投稿" : "RSS投稿"}
+                    {SOURCE_LABELS[key]}
                   </button>
                 ))}
               </div>
@@ -425,20 +453,20 @@ export default function HomePage() {
           </section>
         ) : (
           <div className="grid grid-cols-1 md:grid-cols-2 gap-4">
-              {displayPosts.map((post) => (
+              {displayItems.map(({ post, excerpt, formattedDate }) => (
               <article key={post.id} className="ocean-card p-4 hover:shadow-lg transition-shadow">
                 <Link href={`/posts/${post.id}`} className="block" prefetch={true}>
                   <div className="flex items-center justify-between text-xs text-gray-500">
                     <span>投稿者: {post.author_email ?? "不明"}</span>
-                    <span>{new Date(post.created_at).toLocaleString("ja-JP")}</span>
+                    <span>{formattedDate}</span>
                   </div>
 
                   <h3 className="mt-1 text-lg font-semibold text-gray-900 hover:text-blue-600 transition-colors line-clamp-2">
                     {post.title}
                   </h3>
 
-                  {post.content ? (
-                    <p className="mt-1 text-sm text-gray-600 line-clamp-2">{createExcerpt(post.content, 120)}</p>
+                  {excerpt ? (
+                    <p className="mt-1 text-sm text-gray-600 line-clamp-2">{excerpt}</p>
                   ) : null}
 
                   <div className="mt-2 flex items-center justify-between">
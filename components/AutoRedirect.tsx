@@ -19,14 +19,6 @@ export default function AutoRedirect({ to, delay = 0 }: AutoRedirectProps) {
     return () => clearTimeout(timer);
   }, [router, to, delay]);
 
-  useEffect(() => {
-    const timer = setTimeout(() => {
-      window.location.replace(to);
-    }, delay);
-
-    return () => clearTimeout(timer);
-  }, [to, delay]);
-
   return null;
 }
 
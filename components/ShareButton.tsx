@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useRef, useEffect } from "react";
+import { useState, useRef, useEffect, useMemo } from "react";
 
 interface ShareButtonProps {
   postId: string;
@@ -18,8 +18,14 @@ export default function ShareButton({ postId, postTitle }: ShareButtonProps) {
   const buttonRef = useRef<HTMLButtonElement>(null);
   const dropdownRef = useRef<HTMLDivElement>(null);
 
-  const publicUrl = `${window.location.origin}/posts/${postId}/public`;
-  const shareText = `${postTitle} - Tech Reef`;
+  // 派生値はレンダーごとに作り直さずメモ化する
+  const { publicUrl, shareText } = useMemo(
+    () => ({
+      publicUrl: `${window.location.origin}/posts/${postId}/public`,
+      shareText: `${postTitle} - Tech Reef`
+    }),
+    [postId, postTitle]
+  );
 
   const handleCopyLink = async () => {
     try {
@@ -14,7 +14,6 @@ interface Bookmark {
     url: string;
     summary: string | null;
     created_at: string;
-    metadata: any;
   };
 }
 
@@ -4,6 +4,7 @@ import { ReactNode, useState } from "react";
 import { Comment } from "@/lib/types/comments";
 import CommentForm from "./CommentForm";
 import { useUser } from "@supabase/auth-helpers-react";
+import { formatTimestamp } from "@/lib/utils/date";
 
 interface CommentItemProps {
   comment: Comment;
@@ -59,11 +60,8 @@ export default function CommentItem({
     }
   };
 
-  const handleReactionClick = async (emoji: string) => {
-    const userId = user?.id;
-    const users = comment.reactions[emoji] || [];
-    const hasReacted = userId ? users.includes(userId) : false;
-
+  // hasReactedは描画時に計算済みの値を受け取り、ここで再走査しない
+  const handleReactionClick = async (emoji: string, hasReacted: boolean) => {
     try {
       setIsBusy(true);
       await onReactionToggle(emoji, hasReacted);
@@ -74,10 +72,6 @@ export default function CommentItem({
     }
   };
 
-  const formatDate = (dateString: string) => {
-    return new Date(dateString).toLocaleString("ja-JP");
-  };
-
   const displayAuthor = comment.author?.name || comment.author?.email || `ユーザー${comment.author_id.slice(0, 8)}`;
 
   return (
@@ -88,7 +82,7 @@ export default function CommentItem({
             <div className="flex items-center gap-2 mb-2">
               <span className="font-medium text-sm">{displayAuthor}</span>
               <span className="text-xs text-gray-500">
-                {formatDate(comment.created_at)}
+                {formatTimestamp(comment.created_at)}
               </span>
               {comment.updated_at !== comment.created_at && (
                 <span className="text-xs text-gray-400">(編集済み)</span>
@@ -155,7 +149,7 @@ export default function CommentItem({
             return (
               <button
                 key={emoji}
-                onClick={() => handleReactionClick(emoji)}
+                onClick={() => handleReactionClick(emoji, hasReacted)}
                 disabled={isBusy}
                 className={`flex items-center gap-1 px-2 py-1 rounded-full text-sm transition-colors ${
                   hasReacted
@@ -3,6 +3,7 @@
 import { useState, useEffect } from "react";
 import Link from "next/link";
 import { useRouter } from "next/navigation";
+import { formatDateTime } from "@/lib/utils/date";
 
 interface Post {
   id: string;
@@ -102,16 +103,6 @@ export default function MyPostsList() {
     }
   };
 
-  const formatDate = (dateString: string) => {
-    return new Date(dateString).toLocaleDateString("ja-JP", {
-      year: "numeric",
-      month: "long",
-      day: "numeric",
-      hour: "2-digit",
-      minute: "2-digit"
-    });
-  };
-
   if (loading) {
     return (
       <div className="p-6 text-center">
@@ -193,9 +184,9 @@ export default function MyPostsList() {
               )}
               
               <div className="flex items-center gap-4 text-xs text-gray-500">
-                <span>投稿日: {formatDate(post.created_at)}</span>
+                <span>投稿日: {formatDateTime(post.created_at)}</span>
                 {post.updated_at !== post.created_at && (
-                  <span>更新日: {formatDate(post.updated_at)}</span>
+                  <span>更新日: {formatDateTime(post.updated_at)}</span>
                 )}
               </div>
               
@@ -1,8 +1,9 @@
 "use client";
 
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import Link from "next/link";
 import PostSearch from "./PostSearch";
+import { formatDate } from "@/lib/utils/date";
 
 interface Post {
   id: string;
@@ -19,6 +20,8 @@ interface Post {
   }>;
 }
 
+const ITEMS_PER_PAGE = 10;
+
 interface PostSearchResultsProps {
   initialQuery: string;
   initialTag?: string;
@@ -39,8 +42,8 @@ export default function PostSearchResults({
   const [total, setTotal] = useState(0);
   const [currentPage, setCurrentPage] = useState(1);
   const [hasSearched, setHasSearched] = useState(!!initialQuery);
-
-  const ITEMS_PER_PAGE = 10;
+  // 連続検索時に古いレスポンスが新しい結果を上書きしないよう世代番号で管理
+  const searchSeqRef = useRef(0);
 
   useEffect(() => {
     if (initialQuery) {
@@ -56,6 +59,8 @@ export default function PostSearchResults({
       return;
     }
 
+    const seq = ++searchSeqRef.current;
+
     try {
       setLoading(true);
       setError(null);
@@ -76,15 +81,20 @@ export default function PostSearchResults({
       }
 
       const data = await response.json();
+      if (seq !== searchSeqRef.current) return;
+
       setPosts(data.posts || []);
       setTotal(data.total || 0);
       setCurrentPage(page);
       setHasSearched(true);
     } catch (error) {
+      if (seq !== searchSeqRef.current) return;
       console.error("Search failed:", error);
       setError(error instanceof Error ? error.message : "検索に失敗しました");
     } finally {
-      setLoading(false);
+      if (seq === searchSeqRef.current) {
+        setLoading(false);
+      }
     }
   };
 
@@ -97,14 +107,6 @@ export default function PostSearchResults({
     performSearch(query, page);
   };
 
-  const formatDate = (dateString: string) => {
-    return new Date(dateString).toLocaleDateString("ja-JP", {
-      year: "numeric",
-      month: "long",
-      day: "numeric"
-    });
-  };
-
   const totalPages = Math.ceil(total / ITEMS_PER_PAGE);
 
   return (
@@ -2,6 +2,7 @@
 
 import { useState, useEffect } from "react";
 import Link from "next/link";
+import { formatDateShort } from "@/lib/utils/date";
 
 interface CommentRanking {
   post_id: string;
@@ -18,6 +19,14 @@ interface CommentRankingTableProps {
   onPeriodChange: (period: string) => void;
 }
 
+// レンダーごとに配列を作り直さないようモジュールスコープで定義
+const PERIOD_OPTIONS = [
+  { value: "all", label: "全期間" },
+  { value: "day", label: "今日" },
+  { value: "week", label: "今週" },
+  { value: "month", label: "今月" }
+];
+
 export default function CommentRankingTable({ period, onPeriodChange }: CommentRankingTableProps) {
   const [rankings, setRankings] = useState<CommentRanking[]>([]);
   const [loading, setLoading] = useState(true);
@@ -60,14 +69,6 @@ export default function CommentRankingTable({ period, onPeriodChange }: CommentR
     fetchRankings(newPage, period);
   };
 
-  const formatDate = (dateString: string) => {
-    return new Date(dateString).toLocaleDateString("ja-JP", {
-      year: "numeric",
-      month: "short",
-      day: "numeric"
-    });
-  };
-
   if (loading) {
     return (
       <div className="flex justify-center items-center py-8">
@@ -94,12 +95,7 @@ export default function CommentRankingTable({ period, onPeriodChange }: CommentR
     <div className="space-y-4">
       {/* 期間フィルター */}
       <div className="flex gap-2 mb-4">
-        {[
-          { value: "all", label: "全期間" },
-          { value: "day", label: "今日" },
-          { value: "week", label: "今週" },
-          { value: "month", label: "今月" }
-        ].map(({ value, label }) => (
+        {PERIOD_OPTIONS.map(({ value, label }) => (
           <button
             key={value}
             onClick={() => onPeriodChange(value)}
@@ -170,7 +166,7 @@ export default function CommentRankingTable({ period, onPeriodChange }: CommentR
                     {ranking.author_name || ranking.author_email}
                   </td>
                   <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">
-                    {formatDate(ranking.created_at)}
+                    {formatDateShort(ranking.created_at)}
                   </td>
                   <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">
                     <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-blue-100 text-blue-800">
@@ -221,7 +217,7 @@ export default function CommentRankingTable({ period, onPeriodChange }: CommentR
               
               <div className="flex items-center justify-between text-xs text-gray-500">
                 <span>{ranking.author_name || ranking.author_email}</span>
-                <span>{formatDate(ranking.created_at)}</span>
+                <span>{formatDateShort(ranking.created_at)}</span>
               </div>
             </div>
           ))}
@@ -2,6 +2,7 @@
 
 import { useState, useEffect } from "react";
 import Link from "next/link";
+import { formatDateShort } from "@/lib/utils/date";
 
 interface LikeRanking {
   post_id: string;
@@ -17,6 +18,16 @@ interface LikeRankingTableProps {
   onPeriodChange: (period: string) => void;
 }
 
+// レンダーごとに配列を作り直さないようモジュールスコープで定義
+const MEDALS = ["🥇", "🥈", "🥉"];
+
+const PERIOD_OPTIONS = [
+  { value: "all", label: "すべて" },
+  { value: "day", label: "今日" },
+  { value: "week", label: "今週" },
+  { value: "month", label: "今月" }
+];
+
 export default function LikeRankingTable({ period, onPeriodChange }: LikeRankingTableProps) {
   const [rankings, setRankings] = useState<LikeRanking[]>([]);
   const [loading, setLoading] = useState(true);
@@ -59,14 +70,6 @@ export default function LikeRankingTable({ period, onPeriodChange }: LikeRanking
     fetchRankings(newPage, period);
   };
 
-  const formatDate = (dateString: string) => {
-    return new Date(dateString).toLocaleDateString("ja-JP", {
-      year: "numeric",
-      month: "short",
-      day: "numeric"
-    });
-  };
-
   if (loading) {
     return (
       <div className="flex justify-center items-center py-8">
@@ -97,12 +100,7 @@ export default function LikeRankingTable({ period, onPeriodChange }: LikeRanking
           <h2 className="text-lg font-semibold text-gray-900">期間フィルター</h2>
         </div>
         <div className="flex gap-2">
-          {[
-            { value: "all", label: "すべて" },
-            { value: "day", label: "今日" },
-            { value: "week", label: "今週" },
-            { value: "month", label: "今月" }
-          ].map((option) => (
+          {PERIOD_OPTIONS.map((option) => (
             <button
               key={option.value}
               onClick={() => onPeriodChange(option.value)}
@@ -156,9 +154,9 @@ export default function LikeRankingTable({ period, onPeriodChange }: LikeRanking
                       <span className="text-lg font-bold">
                         {((pagination.page - 1) * pagination.limit) + index + 1}
                       </span>
-                      {index < 3 && (
+                      {index < MEDALS.length && (
                         <span className="ml-2 text-yellow-500">
-                          {index === 0 ? "🥇" : index === 1 ? "🥈" : "🥉"}
+                          {MEDALS[index]}
                         </span>
                       )}
                     </div>
@@ -187,7 +185,7 @@ export default function LikeRankingTable({ period, onPeriodChange }: LikeRanking
                     </div>
                   </td>
                   <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">
-                    {formatDate(ranking.created_at)}
+                    {formatDateShort(ranking.created_at)}
                   </td>
                 </tr>
               ))}
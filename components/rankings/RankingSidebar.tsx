@@ -16,6 +16,18 @@ interface Rankings {
   comments: RankingItem[];
 }
 
+// 3種類のカードは構造が同一なので設定駆動で描画する
+const RANKING_SECTIONS = [
+  { key: "bookmarks", title: "ブックマーク", href: "/rankings/bookmarks" },
+  { key: "likes", title: "いいね", href: "/rankings/likes" },
+  { key: "comments", title: "コメント", href: "/rankings/comments" }
+] as const;
+
+// サイドバーはページ遷移のたびにマウントされるため、取得結果を
+// モジュールスコープに短TTLでキャッシュして再フェッチを抑える
+const CACHE_TTL_MS = 60 * 1000;
+let rankingsCache: { data: Rankings; fetchedAt: number } | null = null;
+
 export default function RankingSidebar() {
   const [rankings, setRankings] = useState<Rankings>({
     bookmarks: [],
@@ -25,13 +37,19 @@ export default function RankingSidebar() {
   const [isLoading, setIsLoading] = useState(true);
 
   useEffect(() => {
+    if (rankingsCache && Date.now() - rankingsCache.fetchedAt < CACHE_TTL_MS) {
+      setRankings(rankingsCache.data);
+      setIsLoading(false);
+      return;
+    }
+
     const fetchRankings = async () => {
       try {
         setIsLoading(true);
         const [bookmarksRes, likesRes, commentsRes] = await Promise.all([
-          fetch("/api/rankings/bookmarks?limit=3"),
-          fetch("/api/rankings/likes?limit=3"),
-          fetch("/api/rankings/comments?limit=3")
+          fetch("/api/rankings/bookmarks?limit=3&count=false"),
+          fetch("/api/rankings/likes?limit=3&count=false"),
+          fetch("/api/rankings/comments?limit=3&count=false")
         ]);
 
         const [bookmarks, likes, comments] = await Promise.all([
@@ -40,11 +58,13 @@ export default function RankingSidebar() {
           commentsRes.ok ? commentsRes.json() : { rankings: [] }
         ]);
 
-        setRankings({
+        const data: Rankings = {
           bookmarks: bookmarks.rankings || [],
           likes: likes.rankings || [],
           comments: comments.rankings || []
-        });
+        };
+        rankingsCache = { data, fetchedAt: Date.now() };
+        setRankings(data);
       } catch (error) {
         console.error("Failed to fetch rankings:", error);
       } finally {
@@ -76,122 +96,45 @@ export default function RankingSidebar() {
 
   return (
     <div className="space-y-6">
-      {/* ブックマークランキング */}
-      <div className="ocean-card p-4">
-        <div className="flex items-center justify-between mb-3">
-          <h3 className="text-lg font-semibold text-gray-900">ブックマーク</h3>
-          <Link 
-            href="/rankings/bookmarks" 
-            className="text-sm text-blue-600 hover:text-blue-800"
-          >
-            すべて見る
-          </Link>
-        </div>
-        <div className="space-y-2">
-          {rankings.bookmarks.length > 0 ? (
-            rankings.bookmarks.map((item, index) => (
-              <div key={item.id} className="flex items-center justify-between">
-                <div className="flex-1 min-w-0">
-                  <Link 
-                    href={`/posts/${item.id}`}
-                    className="text-sm text-gray-900 hover:text-blue-600 line-clamp-2"
-                  >
-                    {item.title}
-                  </Link>
-                  <div className="text-xs text-gray-500 mt-1">
-                    {item.author_email || "不明"}
-                  </div>
-                </div>
-                <div className="flex items-center ml-2">
-                  <span className="text-sm font-medium text-gray-600">
-                    {item.count}
-                  </span>
-                </div>
-              </div>
-            ))
-          ) : (
-            <div className="text-sm text-gray-500">データがありません</div>
-          )}
-        </div>
-      </div>
-
-      {/* いいねランキング */}
-      <div className="ocean-card p-4">
-        <div className="flex items-center justify-between mb-3">
-          <h3 className="text-lg font-semibold text-gray-900">いいね</h3>
-          <Link 
-            href="/rankings/likes" 
-            className="text-sm text-blue-600 hover:text-blue-800"
-          >
-            すべて見る
-          </Link>
-        </div>
-        <div className="space-y-2">
-          {rankings.likes.length > 0 ? (
-            rankings.likes.map((item, index) => (
-              <div key={item.id} className="flex items-center justify-between">
-                <div className="flex-1 min-w-0">
-                  <Link 
-                    href={`/posts/${item.id}`}
-                    className="text-sm text-gray-900 hover:text-blue-600 line-clamp-2"
-                  >
-                    {item.title}
-                  </Link>
-                  <div className="text-xs text-gray-500 mt-1">
-                    {item.author_email || "不明"}
+      {RANKING_SECTIONS.map(({ key, title, href }) => (
+        <div key={key} className="ocean-card p-4">
+          <div className="flex items-center justify-between mb-3">
+            <h3 className="text-lg font-semibold text-gray-900">{title}</h3>
+            <Link 
+              href={href}
+              className="text-sm text-blue-600 hover:text-blue-800"
+            >
+              すべて見る
+            </Link>
+          </div>
+          <div className="space-y-2">
+            {rankings[key].length > 0 ? (
+              rankings[key].map((item) => (
+                <div key={item.id} className="flex items-center justify-between">
+                  <div className="flex-1 min-w-0">
+                    <Link 
+                      href={`/posts/${item.id}`}
+                      className="text-sm text-gray-900 hover:text-blue-600 line-clamp-2"
+                    >
+                      {item.title}
+                    </Link>
+                    <div className="text-xs text-gray-500 mt-1">
+                      {item.author_email || "不明"}
+                    </div>
                   </div>
-                </div>
-                <div className="flex items-center ml-2">
-                  <span className="text-sm font-medium text-gray-600">
-                    {item.count}
-                  </span>
-                </div>
-              </div>
-            ))
-          ) : (
-            <div className="text-sm text-gray-500">データがありません</div>
-          )}
-        </div>
-      </div>
-
-      {/* コメントランキング */}
-      <div className="ocean-card p-4">
-        <div className="flex items-center justify-between mb-3">
-          <h3 className="text-lg font-semibold text-gray-900">コメント</h3>
-          <Link 
-            href="/rankings/comments" 
-            className="text-sm text-blue-600 hover:text-blue-800"
-          >
-            すべて見る
-          </Link>
-        </div>
-        <div className="space-y-2">
-          {rankings.comments.length > 0 ? (
-            rankings.comments.map((item, index) => (
-              <div key={item.id} className="flex items-center justify-between">
-                <div className="flex-1 min-w-0">
-                  <Link 
-                    href={`/posts/${item.id}`}
-                    className="text-sm text-gray-900 hover:text-blue-600 line-clamp-2"
-                  >
-                    {item.title}
-                  </Link>
-                  <div className="text-xs text-gray-500 mt-1">
-                    {item.author_email || "不明"}
+                  <div className="flex items-center ml-2">
+                    <span className="text-sm font-medium text-gray-600">
+                      {item.count}
+                    </span>
                   </div>
                 </div>
-                <div className="flex items-center ml-2">
-                  <span className="text-sm font-medium text-gray-600">
-                    {item.count}
-                  </span>
-                </div>
-              </div>
-            ))
-          ) : (
-            <div className="text-sm text-gray-500">データがありません</div>
-          )}
+              ))
+            ) : (
+              <div className="text-sm text-gray-500">データがありません</div>
+            )}
+          </div>
         </div>
-      </div>
+      ))}
     </div>
   );
 }
@@ -16,15 +16,17 @@ export function useInfiniteScroll({
   const observerRef = useRef<IntersectionObserver | null>(null);
   const loadMoreRef = useRef<HTMLDivElement | null>(null);
 
-  const handleObserver = useCallback(
-    (entries: IntersectionObserverEntry[]) => {
-      const [target] = entries;
-      if (target.isIntersecting && hasMore && !isLoading) {
-        onLoadMore();
-      }
-    },
-    [hasMore, isLoading, onLoadMore]
-  );
+  // 最新の状態はrefで参照し、hasMore/isLoadingが変わるたびに
+  // IntersectionObserverを作り直さないようにする
+  const stateRef = useRef({ hasMore, isLoading, onLoadMore });
+  stateRef.current = { hasMore, isLoading, onLoadMore };
+
+  const handleObserver = useCallback((entries: IntersectionObserverEntry[]) => {
+    const [target] = entries;
+    if (target.isIntersecting && stateRef.current.hasMore && !stateRef.current.isLoading) {
+      stateRef.current.onLoadMore();
+    }
+  }, []);
 
   useEffect(() => {
     if (observerRef.current) {
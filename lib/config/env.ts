@@ -2,5 +2,6 @@ export const env = {
   supabaseUrl: process.env.NEXT_PUBLIC_SUPABASE_URL ?? "",
   supabaseAnonKey: process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY ?? "",
   slackBotToken: process.env.SLACK_BOT_TOKEN ?? "",
-  slackNotificationChannel: process.env.SLACK_NOTIFICATION_CHANNEL ?? ""
+  slackNotificationChannel: process.env.SLACK_NOTIFICATION_CHANNEL ?? "",
+  siteUrl: process.env.NEXT_PUBLIC_SITE_URL ?? process.env.VERCEL_URL ?? "http://localhost:3000"
 };
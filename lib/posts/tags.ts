@@ -0,0 +1,40 @@
+import type { createRouteHandlerClient } from "@supabase/auth-helpers-nextjs";
+
+type SupabaseClient = ReturnType<typeof createRouteHandlerClient>;
+
+// タグ名をupsertしてpost_tagsに紐付ける。POST/PUTの両ルートで共有。
+// タグ処理の失敗は投稿の保存を阻害しないため、エラーはログのみ残す。
+export async function upsertPostTags(
+  supabase: SupabaseClient,
+  postId: string,
+  tags: string[]
+): Promise<void> {
+  if (tags.length === 0) return;
+
+  const tagPayload = tags.map((tagName) => ({
+    name: tagName,
+    description: null
+  }));
+
+  const { data: upsertedTags, error: tagError } = await supabase
+    .from("tags")
+    .upsert(tagPayload, { onConflict: "name" })
+    .select("id, name");
+
+  if (tagError) {
+    console.error("Tag upsert failed:", tagError);
+    return;
+  }
+
+  if (!upsertedTags) return;
+
+  const postTagsPayload = upsertedTags.map((tag) => ({
+    post_id: postId,
+    tag_id: tag.id
+  }));
+
+  const { error: postTagsError } = await supabase.from("post_tags").upsert(postTagsPayload);
+  if (postTagsError) {
+    console.error("Post tags upsert failed:", postTagsError);
+  }
+}
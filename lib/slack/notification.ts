@@ -1,3 +1,8 @@
+import { env } from "@/lib/config/env";
+
+// 成功ログは開発時のみ出す（本番のホットパスでログI/Oを増やさない）
+const isDev = process.env.NODE_ENV !== "production";
+
 interface SlackMessage {
   channel: string;
   text: string;
@@ -131,7 +136,9 @@ export async function sendCommentNotification(data: CommentNotificationData): Pr
       return false;
     }
 
-    console.log("Slack notification sent successfully");
+    if (isDev) {
+      console.log("Slack notification sent successfully");
+    }
     return true;
   } catch (error) {
     console.error("Error sending Slack notification:", error);
@@ -165,12 +172,9 @@ export async function sendDailySummaryNotification(posts: DailyPost[]): Promise<
     weekday: 'long'
   });
 
-  // 投稿詳細ページのURLを生成
-  const baseUrl = process.env.NEXT_PUBLIC_SITE_URL;
-  
   // シンプルなメッセージ形式
-  const postList = posts.map(post => 
-    `• [${post.title}](${baseUrl}/posts/${post.id})`
+  const postList = posts.map(post =>
+    `• [${post.title}](${env.siteUrl}/posts/${post.id})`
   ).join('\n');
 
   const message: SlackMessage = {
@@ -204,7 +208,9 @@ export async function sendDailySummaryNotification(posts: DailyPost[]): Promise<
       return false;
     }
 
-    console.log("Daily summary notification sent successfully");
+    if (isDev) {
+      console.log("Daily summary notification sent successfully");
+    }
     return true;
   } catch (error) {
     console.error("Error sending daily summary notification:", error);
@@ -227,8 +233,7 @@ export async function sendPostNotification(data: PostNotificationData): Promise<
   }
 
   // 投稿詳細ページのURLを生成
-  const baseUrl = process.env.NEXT_PUBLIC_SITE_URL || process.env.VERCEL_URL || 'http://localhost:3000';
-  const postDetailUrl = `${baseUrl}/posts/${data.postId}`;
+  const postDetailUrl = `${env.siteUrl}/posts/${data.postId}`;
 
   const message: SlackMessage = {
     channel: channel as string,
@@ -282,7 +287,9 @@ export async function sendPostNotification(data: PostNotificationData): Promise<
       return false;
     }
 
-    console.log("Post notification sent successfully");
+    if (isDev) {
+      console.log("Post notification sent successfully");
+    }
     return true;
   } catch (error) {
     console.error("Error sending post notification:", error);
@@ -0,0 +1,49 @@
+// 日付フォーマッタの共有モジュール。
+// Intl.DateTimeFormatの生成は高コストなので、呼び出しごとに
+// toLocaleDateString + オプション指定で作り直さずここで使い回す。
+
+const dateFormatter = new Intl.DateTimeFormat("ja-JP", {
+  year: "numeric",
+  month: "long",
+  day: "numeric"
+});
+
+const dateTimeFormatter = new Intl.DateTimeFormat("ja-JP", {
+  year: "numeric",
+  month: "long",
+  day: "numeric",
+  hour: "2-digit",
+  minute: "2-digit"
+});
+
+const dateShortFormatter = new Intl.DateTimeFormat("ja-JP", {
+  year: "numeric",
+  month: "short",
+  day: "numeric"
+});
+
+// toLocaleString("ja-JP")のデフォルト表記（秒まで）と同等
+const timestampFormatter = new Intl.DateTimeFormat("ja-JP", {
+  year: "numeric",
+  month: "numeric",
+  day: "numeric",
+  hour: "numeric",
+  minute: "numeric",
+  second: "numeric"
+});
+
+export function formatDate(dateString: string): string {
+  return dateFormatter.format(new Date(dateString));
+}
+
+export function formatDateShort(dateString: string): string {
+  return dateShortFormatter.format(new Date(dateString));
+}
+
+export function formatDateTime(dateString: string): string {
+  return dateTimeFormatter.format(new Date(dateString));
+}
+
+export function formatTimestamp(dateString: string): string {
+  return timestampFormatter.format(new Date(dateString));
+}
@@ -1,10 +1,21 @@
 import { NextResponse, type NextRequest } from "next/server";
 import { createMiddlewareClient } from "@supabase/auth-helpers-nextjs";
 
-const PUBLIC_PATHS = ["/", "/login", "/_next", "/api/public"];
+// 完全一致で判定するパス。"/"をstartsWithで判定すると全パスが
+// 一致してしまい、認証チェックが一切効かなくなる
+const PUBLIC_PATHS = ["/", "/login", "/site.webmanifest"];
+
+// 前方一致で判定するパス。APIルートは各ハンドラー側で認証する。
+// /brandingは未ログインのログインページやOGP取得からも参照される静的アセット
+const PUBLIC_PREFIXES = ["/_next", "/api", "/auth", "/branding"];
+
+// 共有リンク用の公開ページ
+const PUBLIC_PAGE_PATTERN = /^\/posts\/[^/]+\/public$/;
 
 const isPublicPath = (pathname: string) =>
-  PUBLIC_PATHS.some((path) => pathname === path || pathname.startsWith(path));
+  PUBLIC_PATHS.includes(pathname) ||
+  PUBLIC_PREFIXES.some((prefix) => pathname.startsWith(prefix)) ||
+  PUBLIC_PAGE_PATTERN.test(pathname);
 
 export async function middleware(request: NextRequest) {
   const { pathname } = request.nextUrl;